@@ -1,14 +1,46 @@
 import streamlit as st
 import os
-import tempfile
+import hashlib
+import sqlite3
+import time
+from contextlib import closing
+from types import SimpleNamespace
+import shutil
+import wave
+from concurrent.futures import ThreadPoolExecutor
 import yt_dlp as youtube_dl
-import whisper
+import numpy as np
+import ffmpeg
 from pydub import AudioSegment
-import google.generativeai as genai
-from datetime import datetime
 import asyncio
+import threading
+from utils import split_audio, evict_audio_cache, pick_compute_type
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 
+# "openvino" runs Whisper through optimum-intel instead of CTranslate2, for CPU-only hosts
+WHISPER_BACKEND = os.getenv("WHISPER_BACKEND", "ctranslate2")
+
+# Whisper transcribes silence-split chunks of up to CHUNK_LENGTH_MS on this many threads.
+# The OpenVINO backend decodes fixed 30 s windows, so its chunks are cut to fit one window.
+TRANSCRIBE_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+CHUNK_LENGTH_MS = 30_000 if WHISPER_BACKEND == "openvino" else 120_000
+
+# URLs in a batch download at most this many at a time. Only one is decoded and transcribed at a
+# time, since each holds its full PCM in memory and the shared model's workers are already busy
+DOWNLOAD_CONCURRENCY = 4
+TRANSCRIBE_CONCURRENCY = 1
+
+GEMINI_MODEL_NAME = 'gemini-2.0-flash'
+
+# Transcripts and summaries are memoized across runs in a local SQLite database
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "podcast_extractor")
+CACHE_DB_PATH = os.path.join(CACHE_DIR, "cache.db")
+
+# Downloads are kept by video ID and evicted least-recently-used beyond this size
+AUDIO_CACHE_DIR = os.path.join(CACHE_DIR, "audio")
+AUDIO_CACHE_MAX_BYTES = 5 * 1024 ** 3
+
 st.set_page_config(
     page_title="Podcast Text Extractor Pro",
     page_icon="🎙️",
@@ -22,98 +54,21 @@ if not GEMINI_API_KEY:
     st.warning("Please enter your Google Gemini API Key in the sidebar to continue")
     st.stop()
 
-try:
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel('gemini-2.0-flash')  
-except Exception as e:
-    st.error(f"Failed to initialize Gemini: {str(e)}")
-    st.stop()
 
+@st.cache_data(show_spinner=False)
+def load_css():
+    """Read the stylesheet once instead of rebuilding it on every rerun"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css")) as f:
+        return f"<style>\n{f.read()}</style>"
 
-st.markdown("""
-<style>
-    /* Main background */
-    .main {
-        background-color: rgb(14, 17, 23);
-        color: #ffffff;
-    }
-    
-    /* Text areas */
-    .stTextArea textarea, .stTextArea [data-baseweb=base-input] {
-        background-color: rgb(14, 17, 23) !important;
-        color: #ffffff !important;
-        border: 1px solid #444;
-    }
-    
-    /* Text input */
-    .stTextInput input {
-        background-color: rgb(14, 17, 23) !important;
-        color: #ffffff !important;
-        border: 1px solid #444;
-    }
-    
-    /* Select boxes */
-    .stSelectbox select {
-        background-color: rgb(14, 17, 23) !important;
-        color: #ffffff !important;
-        border: 1px solid #444;
-    }
-    
-    /* Tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        background-color: rgb(14, 17, 23);
-        border-bottom: 1px solid #444;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        color: #ffffff !important;
-    }
-    
-    /* Buttons */
-    .stButton>button {
-        background-color: #4CAF50;
-        color: white;
-        border-radius: 5px;
-        padding: 10px 24px;
-        border: none;
-    }
-    
-    .stButton>button:hover {
-        background-color: #45a049;
-    }
-    
-    /* Metrics */
-    [data-testid="stMetric"] {
-        background-color: rgba(14, 17, 23, 0.7);
-        border: 1px solid #444;
-        border-radius: 5px;
-        padding: 10px;
-    }
-    
-    /* Sidebar */
-    .sidebar .sidebar-content {
-        background-color: rgb(20, 23, 30);
-        color: #ffffff;
-    }
-    
-    /* Footer */
-    .footer {
-        font-size: 0.8rem;
-        color: #aaa;
-        text-align: center;
-        margin-top: 2rem;
-        padding: 1rem;
-        border-top: 1px solid #444;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(load_css(), unsafe_allow_html=True)
 
 
 st.title("🎙️ Podcast Text Extractor Pro")
 st.markdown("""
 <div style='background-color: rgba(20, 23, 30, 0.7); padding: 15px; border-radius: 5px; margin-bottom: 20px; border: 1px solid #444'>
     Extract and summarize text from podcasts or videos. Supports YouTube and other platforms.
-    The audio is transcribed using OpenAI's Whisper model and summarized with Google Gemini.
+    The audio is transcribed using OpenAI's Whisper model (via faster-whisper) and summarized with Google Gemini.
 </div>
 """, unsafe_allow_html=True)
 
@@ -129,6 +84,14 @@ with st.sidebar:
         help="Larger models are more accurate but slower"
     )
     
+    audio_speed = st.select_slider(
+        "Audio Speed-up",
+        options=[1.0, 1.25, 1.5],
+        value=1.0,
+        format_func=lambda speed: f"{speed}×",
+        help="Faster audio means fewer Whisper windows to transcribe, at some cost in accuracy"
+    )
+    
     summary_length = st.selectbox(
         "Summary Length",
         ["Short (1-2 sentences)", "Medium (paragraph)", "Detailed (multiple paragraphs)"],
@@ -138,7 +101,7 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("""
     **How to use:**
-    1. Enter a podcast/video URL
+    1. Enter one or more podcast/video URLs (one per line)
     2. Click 'Extract Text'
     3. View transcript and summary
     4. Download results
@@ -150,189 +113,421 @@ with st.sidebar:
     - Large videos may take time to process
     """)
 
+@st.cache_resource(show_spinner=False)
+def init_cache_db():
+    """Create the cache database once per server process"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with closing(sqlite3.connect(CACHE_DB_PATH)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        for table in ("transcripts", "summaries"):
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT, ts INTEGER)")
+        conn.commit()
+    return CACHE_DB_PATH
+
+def cache_get(table, key):
+    """Look up a cached value, treating any database or filesystem error as a miss"""
+    try:
+        with closing(sqlite3.connect(init_cache_db())) as conn:
+            row = conn.execute(f"SELECT value FROM {table} WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    except (sqlite3.Error, OSError):
+        return None
+
+def cache_put(table, key, value):
+    """Store a value in the cache; failures only cost a future cache miss"""
+    try:
+        with closing(sqlite3.connect(init_cache_db())) as conn, conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {table} (key, value, ts) VALUES (?, ?, ?)",
+                (key, value, int(time.time()))
+            )
+    except (sqlite3.Error, OSError):
+        pass
+
+@st.cache_resource(show_spinner=False)
+def download_locks():
+    """Per-file download locks shared by every session"""
+    return {}
+
 def download_audio(url):
-    """Download audio from URL with improved error handling"""
+    """Download audio from URL, reusing an earlier download of the same video"""
     try:
-        
-        temp_dir = tempfile.gettempdir()
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_template = os.path.join(temp_dir, f'podcast_{timestamp}.%(ext)s')
+        os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+        output_template = os.path.join(AUDIO_CACHE_DIR, '%(extractor_key)s_%(id)s.%(ext)s')
         
         ydl_opts = {
-            'format': 'bestaudio/best',
+            'format': 'bestaudio[acodec^=opus]/bestaudio[ext=m4a]/bestaudio/best',
+            # Store the download as the 16 kHz mono PCM Whisper consumes, so cached files never need decoding again
             'postprocessors': [{
                 'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
+                'preferredcodec': 'wav',
             }],
+            'postprocessor_args': {'extractaudio+ffmpeg_o': ['-ac', '1', '-ar', '16000', '-acodec', 'pcm_s16le']},
             'outtmpl': output_template,
             'quiet': True,
+            'concurrent_fragment_downloads': 8,
+            'http_chunk_size': 10_485_760,
         }
         
+        # aria2c splits plain HTTP downloads over parallel connections; yt-dlp's own downloader is the fallback
+        if shutil.which('aria2c'):
+            ydl_opts['external_downloader'] = 'aria2c'
+            ydl_opts['external_downloader_args'] = {'aria2c': ['-x16', '-s16', '-k1M']}
+        
         with youtube_dl.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=True)
-            
-            
-            filename = ydl.prepare_filename(info)
-            audio_path = filename.replace('.webm', '.mp3').replace('.m4a', '.mp3')
+            info = ydl.extract_info(url, download=False)
+            if info.get('extractor_key') == 'Generic':
+                # The generic extractor takes the ID from the URL's last path segment (episode.mp3, index.m3u8, ...)
+                url_hash = hashlib.blake2b(info.get('webpage_url', url).encode(), digest_size=6).hexdigest()
+                info['id'] = f"{info['id']}_{url_hash}"
+            audio_path = os.path.splitext(ydl.prepare_filename(info))[0] + '.wav'
             
-            
-            if os.path.exists(audio_path):
-                return audio_path
-            else:
-                st.error("Downloaded file not found. FFmpeg may have failed to convert.")
-                return None
+            # Two URLs for the same video would otherwise write the same .part/.temp.wav files at once
+            with download_locks().setdefault(audio_path, threading.Lock()):
+                if os.path.exists(audio_path):
+                    os.utime(audio_path)
+                    return audio_path
+                
+                ydl.process_ie_result(info, download=True)
+                
+                if os.path.exists(audio_path):
+                    evict_audio_cache(AUDIO_CACHE_DIR, AUDIO_CACHE_MAX_BYTES, keep=audio_path)
+                    return audio_path
+                else:
+                    st.error("Downloaded file not found.")
+                    return None
                 
     except Exception as e:
         st.error(f"Download failed: {str(e)}")
         return None
 
-@st.cache_resource
+class OpenVINOWhisperModel:
+    """OpenVINO Whisper behind the subset of the faster-whisper transcribe API this app uses"""
+    
+    def __init__(self, model_size, model_path):
+        from optimum.intel.openvino import OVModelForSpeechSeq2Seq
+        from transformers import AutoProcessor
+        
+        model_id = f"openai/whisper-{'large-v3' if model_size == 'large' else model_size}"
+        export_dir = os.path.join(model_path, f"openvino-{model_size}")
+        # OpenVINO caches the compiled graphs, so only the first start pays for compilation
+        ov_config = {"CACHE_DIR": os.path.join(model_path, "openvino-cache")}
+        
+        if os.path.isdir(export_dir):
+            self.processor = AutoProcessor.from_pretrained(export_dir)
+            self.model = OVModelForSpeechSeq2Seq.from_pretrained(export_dir, use_cache=True, ov_config=ov_config)
+        else:
+            self.processor = AutoProcessor.from_pretrained(model_id, cache_dir=model_path)
+            self.model = OVModelForSpeechSeq2Seq.from_pretrained(
+                model_id, export=True, use_cache=True, cache_dir=model_path, ov_config=ov_config
+            )
+            
+            # Save into a scratch directory and rename it, so a failed export is never mistaken for a finished one
+            staging_dir = f"{export_dir}.tmp"
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            self.processor.save_pretrained(staging_dir)
+            self.model.save_pretrained(staging_dir)
+            os.replace(staging_dir, export_dir)
+        
+        # A compiled OpenVINO model has one infer request, and OpenVINO already uses every core per call
+        self.lock = threading.Lock()
+    
+    def transcribe(self, samples, **kwargs):
+        """Transcribe 16 kHz float32 samples in 30 s windows; faster-whisper-only options are ignored"""
+        import torch
+        
+        window = 30 * 16000
+        windows = [samples[start:start + window] for start in range(0, len(samples), window)]
+        features = self.processor(windows, sampling_rate=16000, return_tensors="pt").input_features
+        
+        with self.lock, torch.inference_mode():
+            token_ids = self.model.generate(features, use_cache=True)
+        texts = self.processor.batch_decode(token_ids, skip_special_tokens=True)
+        return [SimpleNamespace(text=text) for text in texts], None
+
+# Only one model stays resident so browsing sizes can't exhaust memory
+@st.cache_resource(show_spinner=False, max_entries=1)
 def get_whisper_model(model_size="base"):
-    """Cache the Whisper model to prevent repeated downloads"""
+    """Cache the Whisper model to prevent repeated downloads; failures raise so they aren't cached"""
     try:
         
         model_path = os.path.join(os.path.expanduser("~"), ".cache", "whisper")
         if not os.path.exists(model_path):
             os.makedirs(model_path)
         
-        return whisper.load_model(model_size, download_root=model_path)
+        if WHISPER_BACKEND == "openvino":
+            model = OpenVINOWhisperModel(model_size, model_path)
+        else:
+            # Imported here so page reruns never wait on CTranslate2; the first load happens in the preload thread
+            from faster_whisper import WhisperModel
+            import ctranslate2
+            
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+            
+            model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=pick_compute_type(device),
+                cpu_threads=max(1, (os.cpu_count() or 2) // TRANSCRIBE_WORKERS),
+                num_workers=TRANSCRIBE_WORKERS,
+                download_root=model_path
+            )
+        
+        # Warm up on a second of silence so the first real request doesn't pay for kernel/allocator setup
+        segments, _ = model.transcribe(np.zeros(16000, dtype=np.float32), beam_size=1)
+        for _ in segments:
+            pass
+        
+        return model
     except Exception as e:
-        st.error(f"Model loading failed: {str(e)}")
-        return None
+        raise RuntimeError(f"Model loading failed: {str(e)}") from e
 
-def transcribe_audio(audio_path, model_size="base"):
-    """Transcribe audio with proper file handling"""
+def preload_whisper_model(model_size):
+    """Load the Whisper model ahead of use; transcribe_audio reports any failure"""
+    try:
+        get_whisper_model(model_size)
+    except Exception:
+        pass
+
+def hash_file(path):
+    """Content hash of a file, read in 1 MiB blocks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def decode_audio(audio_path, speed=1.0):
+    """Load audio as 16 kHz mono 16-bit PCM, running ffmpeg only if the file needs converting or speeding up"""
+    if speed == 1.0 and audio_path.lower().endswith('.wav'):
+        try:
+            with wave.open(audio_path, 'rb') as wav:
+                if (wav.getnchannels(), wav.getsampwidth(), wav.getframerate()) == (1, 2, 16000):
+                    return AudioSegment(data=wav.readframes(wav.getnframes()), sample_width=2, frame_rate=16000, channels=1)
+        except wave.Error:
+            pass
+    
+    stream = ffmpeg.input(audio_path).audio
+    if speed != 1.0:
+        stream = stream.filter('atempo', speed)
+    
+    try:
+        out, _ = (
+            stream
+            .output('-', format='s16le', acodec='pcm_s16le', ac=1, ar=16000)
+            .run(capture_stdout=True, capture_stderr=True)
+        )
+    except ffmpeg.Error as e:
+        raise RuntimeError(f"ffmpeg could not decode the audio: {e.stderr.decode(errors='replace').strip()}") from e
+    return AudioSegment(data=out, sample_width=2, frame_rate=16000, channels=1)
+
+def transcribe_chunk(model, chunk):
+    """Transcribe a single 16 kHz mono chunk"""
+    samples = np.frombuffer(chunk.raw_data, np.int16).astype(np.float32) / 32768.0
+    segments, info = model.transcribe(
+        samples,
+        beam_size=1,
+        vad_filter=True,
+        condition_on_previous_text=False
+    )
+    return "".join(segment.text for segment in segments).strip()
+
+def transcribe_audio(audio_path, model_size="base", speed=1.0):
+    """Transcribe audio by splitting it on silences and transcribing the chunks in parallel"""
     try:
         if not os.path.exists(audio_path):
             st.error(f"Audio file not found at: {audio_path}")
             return None
         
+        key = f"{hash_file(audio_path)}:{WHISPER_BACKEND}:{model_size}:{speed}"
+        text = cache_get("transcripts", key)
+        if text is not None:
+            return text
+        
+        # Decode before fetching the model so ffmpeg overlaps a model load still running in the background
+        audio = decode_audio(audio_path, speed)
+        chunks = split_audio(audio, CHUNK_LENGTH_MS)
         model = get_whisper_model(model_size)
-        if model is None:
-            return None
-
         
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_wav:
-            temp_wav_path = tmp_wav.name
+        # CTranslate2 releases the GIL while decoding, so the model's workers run the chunks concurrently
+        with ThreadPoolExecutor(max_workers=TRANSCRIBE_WORKERS) as executor:
+            texts = executor.map(lambda chunk: transcribe_chunk(model, chunk), chunks)
+            text = " ".join(text for text in texts if text)
         
-        try:
-            if not audio_path.lower().endswith('.wav'):
-                audio = AudioSegment.from_file(audio_path)
-                audio.export(temp_wav_path, format="wav")
-                result = model.transcribe(temp_wav_path)
-            else:
-                import shutil
-                shutil.copy2(audio_path, temp_wav_path)
-                result = model.transcribe(temp_wav_path)
-            
-            return result["text"]
-        finally:
-            if os.path.exists(temp_wav_path):
-                try:
-                    os.unlink(temp_wav_path)
-                except:
-                    pass
+        if not text:
+            st.warning("No speech was recognized in this audio.")
+            return None
+        
+        cache_put("transcripts", key, text)
+        return text
                     
     except Exception as e:
         st.error(f"Transcription failed: {str(e)}")
         return None
 
-def generate_summary(text, length):
-    """Generate summary using Gemini"""
+@st.cache_resource(show_spinner=False)
+def get_gemini_model():
+    """Configure Gemini on first use so its client library isn't imported before the page renders"""
+    import google.generativeai as genai
+    
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai.GenerativeModel(GEMINI_MODEL_NAME)
+
+def generate_summary(text, length, placeholder):
+    """Generate summary using Gemini, streaming it into placeholder as it arrives"""
     try:
-        with st.spinner("Generating summary..."):
-            length_prompt = {
-                "Short (1-2 sentences)": "Provide a very concise summary in 1-2 sentences.",
-                "Medium (paragraph)": "Provide a summary in one short paragraph.",
-                "Detailed (multiple paragraphs)": "Provide a detailed summary in multiple paragraphs."
-            }[length]
-            
-            prompt = f"""
-            Please summarize the following podcast transcript clearly and accurately.
-            {length_prompt}
-            Focus on the key points and main ideas.
-            
-            Transcript:
-            {text}
-            """
-            
-            response = model.generate_content(prompt)
-            return response.text
+        placeholder.caption("Generating summary...")
+        length_prompt = {
+            "Short (1-2 sentences)": "Provide a very concise summary in 1-2 sentences.",
+            "Medium (paragraph)": "Provide a summary in one short paragraph.",
+            "Detailed (multiple paragraphs)": "Provide a detailed summary in multiple paragraphs."
+        }[length]
+        
+        prompt = f"""
+        Please summarize the following podcast transcript clearly and accurately.
+        {length_prompt}
+        Focus on the key points and main ideas.
+        
+        Transcript:
+        {text}
+        """
+        
+        key = hashlib.sha256(f"{GEMINI_MODEL_NAME}|{prompt}".encode()).hexdigest()
+        summary = cache_get("summaries", key)
+        if summary is not None:
+            placeholder.markdown(summary)
+            return summary
+        
+        parts = []
+        for chunk in get_gemini_model().generate_content(prompt, stream=True):
+            parts.append(chunk.text)
+            placeholder.markdown("".join(parts))
+        
+        summary = "".join(parts)
+        cache_put("summaries", key, summary)
+        return summary
     except Exception as e:
-        st.error(f"Summary generation failed: {str(e)}")
+        placeholder.error(f"Summary generation failed: {str(e)}")
         return None
 
+def run_in_thread(func, *args):
+    """Run func in a worker thread that can still write to this Streamlit session"""
+    ctx = get_script_run_ctx()
+    
+    def target():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return func(*args)
+    
+    return asyncio.to_thread(target)
+
+async def extract_texts(urls, model_size, speed=1.0):
+    """Download and transcribe URLs concurrently through one shared Whisper model"""
+    # The model is loaded by the session preload thread; transcribe_audio waits on it only when it needs it
+    downloads = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+    transcriptions = asyncio.Semaphore(TRANSCRIBE_CONCURRENCY)
+    
+    async def extract_text(url):
+        async with downloads:
+            audio_path = await run_in_thread(download_audio, url)
+        if not audio_path:
+            return None
+        async with transcriptions:
+            return await run_in_thread(transcribe_audio, audio_path, model_size, speed)
+    
+    return await asyncio.gather(*(extract_text(url) for url in urls))
+
+async def generate_summaries(texts, length, placeholders):
+    """Stream the Gemini summaries for all transcripts concurrently"""
+    return await asyncio.gather(*(
+        run_in_thread(generate_summary, text, length, placeholder)
+        for text, placeholder in zip(texts, placeholders)
+    ))
+
+
+# Start loading a newly selected model now so it is resident before "Extract Text" is clicked
+if st.session_state.get("preloaded_model_size") != model_size:
+    st.session_state.preloaded_model_size = model_size
+    preload = threading.Thread(target=preload_whisper_model, args=(model_size,), daemon=True)
+    add_script_run_ctx(preload, get_script_run_ctx())
+    preload.start()
 
 col1, col2 = st.columns([3, 1])
 with col1:
-    url = st.text_input("Enter podcast/video URL:", placeholder="https://youtu.be/...")
+    url_input = st.text_area(
+        "Enter podcast/video URLs (one per line):",
+        placeholder="https://youtu.be/...",
+        height=100
+    )
+    urls = list(dict.fromkeys(line.strip() for line in url_input.splitlines() if line.strip()))
 with col2:
     st.write("")
     st.write("")
     process_btn = st.button("Extract Text", key="process")
 
 if process_btn:
-    if not url:
+    if not urls:
         st.warning("Please enter a URL")
     else:
         with st.spinner("Initializing..."):
-            audio_path = download_audio(url)
+            texts = asyncio.run(extract_texts(urls, model_size, audio_speed))
+        
+        results = []
+        for index, (url, text) in enumerate(zip(urls, texts)):
+            if not text:
+                st.warning(f"{url}: could not be processed")
+                continue
             
-            if audio_path:
-                text = transcribe_audio(audio_path, model_size)
+            if len(urls) > 1:
+                st.subheader(url)
+            
+            tab1, tab2, tab3 = st.tabs(["Transcript", "Summary", "Stats"])
+            
+            with tab1:
+                st.subheader("Full Transcript")
+                st.text_area("Transcript", text, height=400, label_visibility="collapsed", key=f"transcript_{index}")
                 
-                if text:
-                    
-                    try:
-                        if os.path.exists(audio_path):
-                            os.remove(audio_path)
-                    except:
-                        pass
-                    
-                    
-                    tab1, tab2, tab3 = st.tabs(["Transcript", "Summary", "Stats"])
-                    
-                    with tab1:
-                        st.subheader("Full Transcript")
-                        st.text_area("Transcript", text, height=400, label_visibility="collapsed")
-                        
-                        st.download_button(
-                            label="Download Transcript",
-                            data=text,
-                            file_name="transcript.txt",
-                            mime="text/plain"
-                        )
-                    
-                    summary = generate_summary(text, summary_length)
-                    
-                    with tab2:
-                        st.subheader("AI Summary")
-                        if summary:
-                            st.markdown(f'<div style="background-color: rgb(14, 17, 23); padding: 10px; border-radius: 5px; border: 1px solid #444">{summary}</div>', unsafe_allow_html=True)
-                            st.download_button(
-                                label="Download Summary",
-                                data=summary,
-                                file_name="summary.txt",
-                                mime="text/plain"
-                            )
-                        else:
-                            st.warning("Summary could not be generated")
-                    
-                    with tab3:
-                        st.subheader("Statistics")
-                        word_count = len(text.split())
-                        char_count = len(text)
-                        duration = len(text.split()) / 130  
-                        
-                        st.metric("Word Count", f"{word_count:,}")
-                        st.metric("Character Count", f"{char_count:,}")
-                        st.metric("Estimated Duration", f"{duration:.1f} minutes")
-                        
-                        st.info("Note: Duration estimation assumes 130 words per minute speech rate")
+                st.download_button(
+                    label="Download Transcript",
+                    data=text,
+                    file_name=f"transcript_{index + 1}.txt",
+                    mime="text/plain",
+                    key=f"download_transcript_{index}"
+                )
+            
+            with tab2:
+                st.subheader("AI Summary")
+                results.append((index, text, st.container(border=True).empty(), st.empty()))
+            
+            with tab3:
+                st.subheader("Statistics")
+                word_count = len(text.split())
+                char_count = len(text)
+                duration = word_count / 130
+                
+                st.metric("Word Count", f"{word_count:,}")
+                st.metric("Character Count", f"{char_count:,}")
+                st.metric("Estimated Duration", f"{duration:.1f} minutes")
+                
+                st.info("Note: Duration estimation assumes 130 words per minute speech rate")
+        
+        # Every tab is on the page already, so the summaries stream in side by side
+        summaries = asyncio.run(generate_summaries(
+            [text for _, text, _, _ in results],
+            summary_length,
+            [placeholder for _, _, placeholder, _ in results]
+        ))
+        
+        for (index, _, _, actions), summary in zip(results, summaries):
+            if summary:
+                actions.download_button(
+                    label="Download Summary",
+                    data=summary,
+                    file_name=f"summary_{index + 1}.txt",
+                    mime="text/plain",
+                    key=f"download_summary_{index}"
+                )
+            else:
+                actions.warning("Summary could not be generated")
 
 
 st.markdown("""
@@ -0,0 +1,109 @@
+import os
+import sys
+import types
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import split_audio, evict_audio_cache, pick_compute_type
+
+
+def tone(duration_ms):
+    return Sine(440, sample_rate=16000, bit_depth=16).to_audio_segment(duration=duration_ms, volume=-10).set_channels(1)
+
+def silence(duration_ms):
+    return AudioSegment.silent(duration=duration_ms, frame_rate=16000).set_sample_width(2)
+
+def joined(chunks):
+    return b"".join(chunk.raw_data for chunk in chunks)
+
+
+def test_split_audio_keeps_every_sample():
+    audio = tone(3000) + silence(1000) + tone(3000) + silence(1000) + tone(3000)
+    chunks = split_audio(audio, max_chunk_ms=4000)
+
+    assert len(chunks) > 1
+    assert joined(chunks) == audio.raw_data
+
+def test_split_audio_caps_chunks_when_silence_allows_a_cut():
+    audio = tone(3000) + silence(1000) + tone(3000) + silence(1000) + tone(3000)
+    chunks = split_audio(audio, max_chunk_ms=4000)
+
+    assert all(len(chunk) <= 4000 for chunk in chunks)
+
+def test_split_audio_keeps_quiet_speech():
+    quiet = tone(3000).apply_gain(-35)
+    audio = quiet + silence(1000) + quiet
+    chunks = split_audio(audio, max_chunk_ms=60_000)
+
+    assert joined(chunks) == audio.raw_data
+
+def test_split_audio_without_silence_is_one_chunk():
+    audio = tone(5000)
+    chunks = split_audio(audio, max_chunk_ms=2000)
+
+    assert len(chunks) == 1
+    assert chunks[0].raw_data == audio.raw_data
+
+def test_split_audio_handles_silent_input():
+    audio = silence(5000)
+    chunks = split_audio(audio, max_chunk_ms=60_000)
+
+    assert chunks
+    assert joined(chunks) == audio.raw_data
+
+def test_split_audio_handles_empty_input():
+    assert split_audio(AudioSegment.empty(), max_chunk_ms=60_000) == []
+
+
+def write_file(path, size, mtime):
+    with open(path, "wb") as f:
+        f.write(b"\0" * size)
+    os.utime(path, (mtime, mtime))
+
+def test_evict_audio_cache_removes_least_recently_used(tmp_path):
+    write_file(tmp_path / "old.wav", 100, 1000)
+    write_file(tmp_path / "mid.wav", 100, 2000)
+    write_file(tmp_path / "new.wav", 100, 3000)
+
+    evict_audio_cache(str(tmp_path), 200, keep=str(tmp_path / "new.wav"))
+
+    assert sorted(os.listdir(tmp_path)) == ["mid.wav", "new.wav"]
+
+def test_evict_audio_cache_never_removes_kept_file(tmp_path):
+    write_file(tmp_path / "kept.wav", 300, 1000)
+
+    evict_audio_cache(str(tmp_path), 200, keep=str(tmp_path / "kept.wav"))
+
+    assert os.listdir(tmp_path) == ["kept.wav"]
+
+def test_evict_audio_cache_ignores_in_flight_files(tmp_path):
+    write_file(tmp_path / "a.webm.part", 500, 1000)
+    write_file(tmp_path / "b.temp.wav", 500, 1000)
+    write_file(tmp_path / "c.wav", 100, 2000)
+
+    evict_audio_cache(str(tmp_path), 200, keep=None)
+
+    assert sorted(os.listdir(tmp_path)) == ["a.webm.part", "b.temp.wav", "c.wav"]
+
+
+def fake_ctranslate2(monkeypatch, supported):
+    module = types.SimpleNamespace(get_supported_compute_types=lambda device: supported[device])
+    monkeypatch.setitem(sys.modules, "ctranslate2", module)
+
+def test_pick_compute_type_prefers_int8_with_half_precision(monkeypatch):
+    fake_ctranslate2(monkeypatch, {
+        "cuda": {"float32", "float16", "int8", "int8_float16"},
+        "cpu": {"float32", "int8", "int8_bfloat16"},
+    })
+
+    assert pick_compute_type("cuda") == "int8_float16"
+    assert pick_compute_type("cpu") == "int8_bfloat16"
+
+def test_pick_compute_type_falls_back(monkeypatch):
+    fake_ctranslate2(monkeypatch, {"cuda": {"float32", "float16"}, "cpu": {"float32"}})
+
+    assert pick_compute_type("cuda") == "float16"
+    assert pick_compute_type("cpu") == "default"
@@ -0,0 +1,62 @@
+"""Helpers for the audio pipeline that don't depend on the Streamlit page"""
+import os
+
+from pydub.silence import detect_silence
+
+
+def split_audio(audio, max_chunk_ms):
+    """Cut audio at the middle of its silences into chunks of up to max_chunk_ms; nothing is discarded"""
+    silences = detect_silence(
+        audio,
+        min_silence_len=700,
+        silence_thresh=audio.dBFS - 16,
+        seek_step=50
+    )
+    
+    # A chunk only runs past max_chunk_ms when there is no silence to cut at
+    chunks = []
+    start = last_cut = 0
+    for cut in [(silence_start + silence_end) // 2 for silence_start, silence_end in silences] + [len(audio)]:
+        if cut - start > max_chunk_ms and last_cut > start:
+            chunks.append(audio[start:last_cut])
+            start = last_cut
+        last_cut = cut
+    
+    if start < len(audio):
+        chunks.append(audio[start:])
+    return chunks
+
+def evict_audio_cache(cache_dir, max_bytes, keep):
+    """Delete the least recently used downloads in cache_dir until it fits in max_bytes"""
+    # Only finished downloads count; other sessions keep creating and renaming their .part/.temp.wav files
+    files = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if not name.endswith('.wav') or name.endswith('.temp.wav'):
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+    
+    total = 0
+    for _, size, path in sorted(files, reverse=True):
+        total += size
+        if total > max_bytes and path != keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def pick_compute_type(device):
+    """Pick the lowest precision the device supports, preferring INT8 weights with FP16/BF16 activations"""
+    import ctranslate2
+    
+    if device == "cuda":
+        preferred = ("int8_float16", "int8_bfloat16", "float16", "int8")
+    else:
+        preferred = ("int8_bfloat16", "int8", "bfloat16")
+    
+    supported = ctranslate2.get_supported_compute_types(device)
+    return next((compute_type for compute_type in preferred if compute_type in supported), "default")